@@ -1,11 +1,20 @@
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from mangum import Mangum
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+import dataclasses
+import json
 import logging
 import time
 import os
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to Starlette's json encoder
+    orjson = None
+
 from services.narrative_generator import generate_narrative_analysis
 from models.validated_request import AnalysisRequest
 from security.auth import verify_api_key, check_rate_limit
@@ -18,10 +27,26 @@ from services.iac_generator import generate_iac
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+class DataclassJSONResponse(JSONResponse):
+    """Stdlib fallback that, like orjson, serializes the dataclass results"""
+    
+    def render(self, content) -> bytes:
+        return json.dumps(
+            content,
+            default=dataclasses.asdict,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+# Routes return this directly so payloads skip FastAPI's jsonable_encoder pass
+ResponseClass = ORJSONResponse if orjson else DataclassJSONResponse
+
 app = FastAPI(
     title="AWS Friendly Counsellor v3.0",
     description="Production-ready AWS architecture advisor",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ResponseClass
 )
 
 app.add_middleware(
@@ -32,6 +57,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+def _run_pipeline(request: AnalysisRequest):
+    """Classification -> services -> costs -> guide, shared by the analysis endpoints"""
+    return _pipeline(request.description, request.estimated_users)
+
+@lru_cache(maxsize=1024)
+def _pipeline(description: str, estimated_users: int):
+    # Memoized so analyze -> narrative -> iac for the same project runs it once;
+    # results are shared between requests and must not be mutated
+    classification = classify_use_case(description)
+    services = recommend_services(classification, estimated_users)
+    service_names = [s.name for s in services]
+    cost_analysis = calculate_costs(service_names, estimated_users)
+    guide = generate_guide(service_names, classification, estimated_users)
+    return classification, services, service_names, cost_analysis, guide
+
+@lru_cache(maxsize=256)
+def _narrative(description: str, estimated_users: int) -> str:
+    # The narrative is a pure function of the pipeline output, so it is keyed
+    # on the same request fields as _pipeline
+    classification, services, _, cost_analysis, guide = _pipeline(description, estimated_users)
+    return generate_narrative_analysis(
+        services=services,
+        classification=classification,
+        cost_analysis=cost_analysis,
+        implementation_guide=guide,
+        estimated_users=estimated_users
+    )
+
 @app.get("/")
 async def root():
     return {
@@ -42,99 +98,102 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "timestamp": _timestamp()}
 
-@app.post("/api/analyze")
-async def analyze(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
+@app.post("/api/analyze", response_model=None)
+def analyze(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
     start_time = time.time()
     try:
         if api_key != "anonymous":
             check_rate_limit(api_key)
         
-        classification = classify_use_case(request.description)
-        services = recommend_services(classification, request.estimated_users)
-        service_names = [s["name"] for s in services]
-        cost_analysis = calculate_costs(service_names, request.estimated_users)
-        guide = generate_guide(service_names, classification, request.estimated_users)
+        classification, services, service_names, cost_analysis, guide = _run_pipeline(request)
         
-        return {
+        return ResponseClass({
             "project_id": f"proj_{int(time.time())}",
             "analysis": {
-                "project_type": classification["primary"],
-                "confidence": classification["confidence"],
-                "detected_features": classification["features"]
+                "project_type": classification.primary,
+                "confidence": classification.confidence,
+                "detected_features": classification.features
             },
             "services": services,
             "cost_analysis": cost_analysis,
             "implementation_guide": guide,
             "metadata": {
                 "processing_time_ms": int((time.time() - start_time) * 1000),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _timestamp()
             }
-        }
+        })
     except Exception as e:
         logger.exception(f"Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/iac")
-async def generate_infrastructure_code(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
+@app.post("/api/iac", response_model=None)
+def generate_infrastructure_code(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
     start_time = time.time()
     try:
-        classification = classify_use_case(request.description)
-        services = recommend_services(classification, request.estimated_users)
+        classification, services, _, _, _ = _run_pipeline(request)
         iac_output = generate_iac(services, classification, request.estimated_users)
         
-        return {
+        return ResponseClass({
             "project_id": f"iac_{int(time.time())}",
             "analysis": {
-                "project_type": classification["primary"],
+                "project_type": classification.primary,
                 "services_count": len(services)
             },
             "terraform": iac_output,
             "metadata": {
                 "processing_time_ms": int((time.time() - start_time) * 1000),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _timestamp()
             }
-        }
+        })
     except Exception as e:
         logger.exception(f"Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/narrative")
-async def generate_narrative(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
+@app.post("/api/narrative", response_model=None)
+def generate_narrative(request: AnalysisRequest, api_key: str = Depends(verify_api_key)):
     """Generate comprehensive narrative analysis"""
     start_time = time.time()
     try:
-        classification = classify_use_case(request.description)
-        services = recommend_services(classification, request.estimated_users)
-        service_names = [s["name"] for s in services]
-        cost_analysis = calculate_costs(service_names, request.estimated_users)
-        guide = generate_guide(service_names, classification, request.estimated_users)
-        
-        narrative_html = generate_narrative_analysis(
-            services=services,
-            classification=classification,
-            cost_analysis=cost_analysis,
-            implementation_guide=guide,
-            estimated_users=request.estimated_users
-        )
+        narrative_html = _narrative(request.description, request.estimated_users)
         
         response_data = {
             "project_id": f"narrative_{int(time.time())}",
             "narrative_html": narrative_html,
             "metadata": {
                 "processing_time_ms": int((time.time() - start_time) * 1000),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _timestamp()
             }
         }
         
         processing_time = response_data['metadata']['processing_time_ms']
-        logger.info(f"Narrative generated in {processing_time}ms")
+        logger.info("Narrative generated in %dms", processing_time)
         
-        return response_data
+        return ResponseClass(response_data)
         
     except Exception as e:
         logger.exception(f"Error generating narrative: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-handler = Mangum(app, lifespan="off")
+# Lambda entry point; outside Lambda `app` is served directly by uvicorn
+handler = Mangum(app, lifespan="off") if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else None
+
+if __name__ == "__main__":
+    import uvicorn
+    # One process by default: without REDIS_URL each worker keeps its own
+    # rate limit counters, multiplying the effective per-key limit
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1 and not os.getenv("REDIS_URL"):
+        logger.warning(
+            "Running %d workers without REDIS_URL: rate limits are per worker, "
+            "so each key gets up to %d x the configured limit", workers, workers
+        )
+    uvicorn.run(
+        "handler:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=workers,
+        loop="uvloop",
+        http="httptools"
+    )
@@ -4,6 +4,8 @@ from datetime import datetime
 import html
 import re
 
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 class AnalysisRequest(BaseModel):
     description: str = Field(
@@ -37,11 +39,9 @@ class AnalysisRequest(BaseModel):
     
     @validator('description')
     def sanitize_description(cls, v: str) -> str:
-        v = v.strip()
-        v = html.escape(v)
-        v = ' '.join(v.split())
+        v = WHITESPACE_RE.sub(' ', html.escape(v.strip()))
         
-        if len(v.strip()) < 10:
+        if len(v) < 10:
             raise ValueError("Description too short")
         
         return v
@@ -1,32 +1,69 @@
 from fastapi import Security, HTTPException
 from fastapi.security import APIKeyHeader
-from collections import defaultdict
+from collections import defaultdict, deque
+import hmac
 import os
 import time
+import uuid
 import logging
 
+try:
+    import redis
+except ImportError:  # Optional: without Redis the limiter stays in-process
+    redis = None
+
 logger = logging.getLogger(__name__)
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 # In-memory storage
-rate_limit_storage = defaultdict(list)
-request_cache = {}
+rate_limit_storage = defaultdict(deque)
 
-VALID_API_KEYS = set(os.getenv("VALID_API_KEYS", "demo-key-12345").split(","))
+VALID_API_KEYS = frozenset(filter(None, os.getenv("VALID_API_KEYS", "demo-key-12345").split(",")))
+ALLOW_ANONYMOUS = os.getenv("ALLOW_ANONYMOUS", "true").lower() == "true"
 RATE_LIMIT_REQUESTS = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
 RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", "3600"))
 CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))
+REDIS_URL = os.getenv("REDIS_URL")
+# Seconds; a slow or unreachable Redis must not hold a request until Lambda times out
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.5"))
+
+# Rolling window on a sorted set: evict expired hits, count, record - atomically
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], window)
+return 1
+"""
+
+# Shared storage across Lambda containers (script is sent once, then EVALSHA)
+redis_client = redis.Redis.from_url(
+    REDIS_URL,
+    socket_timeout=REDIS_TIMEOUT,
+    socket_connect_timeout=REDIS_TIMEOUT
+) if redis and REDIS_URL else None
+rate_limit_script = redis_client.register_script(RATE_LIMIT_SCRIPT) if redis_client else None
+
+
+def _is_valid_api_key(api_key: str) -> bool:
+    # Check every key so response time doesn't reveal partial matches
+    candidate = api_key.encode()
+    return any([hmac.compare_digest(key.encode(), candidate) for key in VALID_API_KEYS])
 
 
 def verify_api_key(api_key: str = Security(api_key_header)) -> str:
     if not api_key:
-        if os.getenv("ALLOW_ANONYMOUS", "true").lower() == "true":
-            logger.warning("Anonymous request allowed")
+        if ALLOW_ANONYMOUS:
+            logger.debug("Anonymous request allowed")
             return "anonymous"
         raise HTTPException(status_code=401, detail="API key required")
     
-    if api_key not in VALID_API_KEYS:
+    if not _is_valid_api_key(api_key):
         logger.warning(f"Invalid API key: {api_key[:10]}...")
         raise HTTPException(status_code=403, detail="Invalid API key")
     
@@ -35,10 +72,30 @@ def verify_api_key(api_key: str = Security(api_key_header)) -> str:
 
 def check_rate_limit(api_key: str) -> None:
     now = time.time()
+    
+    if rate_limit_script is not None:
+        try:
+            allowed = rate_limit_script(
+                keys=[f"rl:{api_key}"],
+                args=[now, RATE_LIMIT_WINDOW, RATE_LIMIT_REQUESTS, uuid.uuid4().hex]
+            )
+        except redis.RedisError as e:
+            # Fail open to the per-container limiter rather than rejecting the request
+            logger.warning("Redis rate limiter unavailable, using in-process limit: %s", e)
+        else:
+            if not allowed:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Rate limit exceeded. Try again later."
+                )
+            return
+    
     window_start = now - RATE_LIMIT_WINDOW
     
-    requests = [r for r in rate_limit_storage[api_key] if r > window_start]
-    rate_limit_storage[api_key] = requests
+    # Timestamps are appended in order: expired hits are always at the left
+    requests = rate_limit_storage[api_key]
+    while requests and requests[0] <= window_start:
+        requests.popleft()
     
     if len(requests) >= RATE_LIMIT_REQUESTS:
         raise HTTPException(
@@ -47,4 +104,4 @@ def check_rate_limit(api_key: str) -> None:
         )
     
     requests.append(now)
-    logger.info(f"Rate limit: {len(requests)}/{RATE_LIMIT_REQUESTS}")
+    logger.info("Rate limit: %d/%d", len(requests), RATE_LIMIT_REQUESTS)
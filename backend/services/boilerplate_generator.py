@@ -3,15 +3,19 @@ Boilerplate Code Generator
 Generates ready-to-use Lambda handlers and Frontend code
 WITHOUT modifying existing modules
 """
-from typing import Dict, List, Any
+from typing import Dict, Any, Sequence
+from functools import lru_cache
 import logging
 
+from services.classifier import Classification
+from services.recommender import Recommendation
+
 logger = logging.getLogger(__name__)
 
 
 def generate_boilerplate(
-    services: List[Dict],
-    classification: Dict,
+    services: Sequence[Recommendation],
+    classification: Classification,
     estimated_users: int
 ) -> Dict[str, Any]:
     """
@@ -25,7 +29,7 @@ def generate_boilerplate(
     Returns:
         Dict with backend and frontend code files
     """
-    project_type = classification.get("primary", "application")
+    project_type = classification.primary
     
     logger.info(f"Generating boilerplate for {project_type}")
     
@@ -45,13 +49,13 @@ def generate_boilerplate(
     }
 
 
-def generate_lambda_handler(services: List[Dict], project_type: str, users: int) -> Dict[str, str]:
+def generate_lambda_handler(services: Sequence[Recommendation], project_type: str, users: int) -> Dict[str, str]:
     """Generate Lambda handler code"""
     
     # Check which services are used
-    has_dynamodb = any('dynamodb' in s['name'].lower() for s in services)
-    has_cognito = any('cognito' in s['name'].lower() for s in services)
-    has_s3 = any('s3' in s['name'].lower() for s in services)
+    has_dynamodb = any('dynamodb' in s.name.lower() for s in services)
+    has_cognito = any('cognito' in s.name.lower() for s in services)
+    has_s3 = any('s3' in s.name.lower() for s in services)
     
     # Generate handler based on project type
     if project_type == "ecommerce":
@@ -64,6 +68,7 @@ def generate_lambda_handler(services: List[Dict], project_type: str, users: int)
         return generate_generic_handler(has_dynamodb)
 
 
+@lru_cache(maxsize=None)
 def generate_ecommerce_handler(has_db: bool, has_s3: bool) -> Dict[str, str]:
     """Generate ecommerce Lambda handler"""
     
@@ -265,6 +270,7 @@ curl -X POST https://your-api-url/products \\
     }
 
 
+@lru_cache(maxsize=None)
 def generate_api_handler(has_db: bool) -> Dict[str, str]:
     """Generate generic API Lambda handler"""
     
@@ -359,7 +365,7 @@ def generate_generic_handler(has_db: bool) -> Dict[str, str]:
     return generate_api_handler(has_db)
 
 
-def generate_frontend_code(services: List[Dict], project_type: str) -> Dict[str, str]:
+def generate_frontend_code(services: Sequence[Recommendation], project_type: str) -> Dict[str, str]:
     """Generate frontend code"""
     
     if project_type == "ecommerce":
@@ -368,6 +374,7 @@ def generate_frontend_code(services: List[Dict], project_type: str) -> Dict[str,
         return generate_generic_frontend()
 
 
+@lru_cache(maxsize=None)
 def generate_ecommerce_frontend() -> Dict[str, str]:
     """Generate ecommerce frontend"""
     
@@ -579,6 +586,7 @@ createProduct({
     }
 
 
+@lru_cache(maxsize=None)
 def generate_generic_frontend() -> Dict[str, str]:
     """Generate generic frontend"""
     
@@ -1,6 +1,16 @@
-from typing import Dict, Any
+from typing import Dict, Tuple
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring scan
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 USE_CASE_KEYWORDS = {
@@ -16,38 +26,90 @@ USE_CASE_KEYWORDS = {
     "analytics": ["analytics", "tracking", "metrics", "dashboard", "reporting"],
 }
 
-def classify_use_case(description: str) -> Dict[str, Any]:
-    logger.info(f"Classifying: {description[:100]}...")
-    
-    description_lower = description.lower()
-    scores = {}
+
+
+@dataclass(frozen=True)
+class Classification:
+    """Immutable classifier result, shared safely between cached callers"""
+    __slots__ = ("primary", "confidence", "features")
     
+    primary: str
+    confidence: float
+    features: Tuple[str, ...]
+
+
+# Flattened once at import: (lowercased keyword, category index)
+CATEGORY_NAMES = tuple(USE_CASE_KEYWORDS)
+KEYWORD_CATEGORIES = tuple(
+    (kw.lower(), index)
+    for index, keywords in enumerate(USE_CASE_KEYWORDS.values())
+    for kw in keywords
+)
+
+
+def _build_keyword_automaton():
+    automaton = ahocorasick.Automaton()
     for category, keywords in USE_CASE_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in description_lower)
-        if score > 0:
-            scores[category] = score
+        for kw in keywords:
+            automaton.add_word(kw, (category, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass multi-keyword matcher, built once at import
+KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick else None
+
+
+def _score_keywords(description_lower: str) -> Dict[str, int]:
+    """Count distinct keyword hits per category, in USE_CASE_KEYWORDS order"""
+    if KEYWORD_AUTOMATON is not None:
+        matched = {match for _, match in KEYWORD_AUTOMATON.iter(description_lower)}
+        hits = Counter(category for category, _ in matched)
+        return {category: hits[category] for category in USE_CASE_KEYWORDS if hits[category]}
+    
+    counts = [0] * len(CATEGORY_NAMES)
+    for kw, index in KEYWORD_CATEGORIES:
+        if kw in description_lower:
+            counts[index] += 1
+    return {CATEGORY_NAMES[i]: count for i, count in enumerate(counts) if count}
+
+
+def classify_use_case(description: str) -> Classification:
+    logger.debug("Classifying: %s...", description[:100])
+    
+    classification = _classify(description)
+    
+    logger.debug("Classification: %s (confidence: %.2f)", classification.primary, classification.confidence)
+    
+    return classification
+
+
+@lru_cache(maxsize=4096)
+def _classify(description: str) -> Classification:
+    scores = _score_keywords(description.lower())
     
     if not scores:
-        return {
-            "primary": "web_application",
-            "confidence": 0.5,
-            "features": ["web_application"]
-        }
+        return Classification(
+            primary="web_application",
+            confidence=0.5,
+            features=("web_application",)
+        )
     
-    sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    primary = sorted_scores[0][0]
-    max_score = sorted_scores[0][1]
+    # Only the top four categories are used, so skip the full sort
+    if len(scores) == 1:
+        top_scores = list(scores.items())
+    else:
+        top_scores = nlargest(4, scores.items(), key=itemgetter(1))
+    primary, max_score = top_scores[0]
     
     confidence = min(max_score / 5.0, 1.0)
-    if len(sorted_scores) > 1 and sorted_scores[1][1] >= max_score * 0.7:
+    if len(top_scores) > 1 and top_scores[1][1] >= max_score * 0.7:
         confidence *= 0.9
     
-    features = [cat for cat, _ in sorted_scores[:4]]
-    
-    logger.info(f"Classification: {primary} (confidence: {confidence:.2f})")
+    features = tuple(cat for cat, _ in top_scores)
     
-    return {
-        "primary": primary,
-        "confidence": confidence,
-        "features": features
-    }
+    return Classification(
+        primary=primary,
+        confidence=confidence,
+        features=features
+    )
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,27 +37,44 @@ AWS_SERVICES_DB = {
     },
 }
 
+
+def _parse_monthly_range(typical: str) -> Tuple[float, float]:
+    parts = typical.split("-")
+    min_cost = float(parts[0])
+    max_cost = float(parts[1]) if len(parts) > 1 else min_cost * 2
+    return min_cost, max_cost
+
+
+# Parsed once at import: service_id -> (name, min_cost, max_cost)
+SERVICE_COST_TABLE = {
+    service_id: (service["name"], *_parse_monthly_range(service["typical_monthly"]))
+    for service_id, service in AWS_SERVICES_DB.items()
+}
+
+
 def calculate_costs(services: List[str], users: int) -> Dict:
-    logger.info(f"Calculating costs for {len(services)} services, {users} users")
+    logger.debug("Calculating costs for %d services, %d users", len(services), users)
     
+    # Totals depend only on the services, so user count is not part of the key
+    return _calculate(tuple(services))
+
+
+@lru_cache(maxsize=1024)
+def _calculate(services: Tuple[str, ...]) -> Dict:
+    # Result is shared between calls: treat it as read-only
     total_min = 0
     total_max = 0
     breakdown = {}
     
     for service_id in services:
-        if service_id not in AWS_SERVICES_DB:
+        entry = SERVICE_COST_TABLE.get(service_id)
+        if entry is None:
             continue
         
-        service = AWS_SERVICES_DB[service_id]
-        typical = service["typical_monthly"]
-        
-        parts = typical.split("-")
-        min_cost = float(parts[0])
-        max_cost = float(parts[1]) if len(parts) > 1 else min_cost * 2
-        
+        name, min_cost, max_cost = entry
         total_min += min_cost
         total_max += max_cost
-        breakdown[service["name"]] = f"${min_cost}-{max_cost}"
+        breakdown[name] = f"${min_cost}-{max_cost}"
     
     typical = (total_min + total_max) / 2
     
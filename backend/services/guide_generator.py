@@ -2,17 +2,109 @@
 Implementation Guide Generator - DYNAMIC & PERSONALIZED
 Generates contextual implementation guides based on services and scale
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Sequence, Set, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
+import re
+
+from services.classifier import Classification
 
 logger = logging.getLogger(__name__)
 
 
-def generate_guide(services: List[str], classification: Dict, estimated_users: int) -> Dict[str, Any]:
-    """Generate DYNAMIC implementation guide based on project specifics"""
+# Frozen, slotted guide records (field order is the JSON key order).
+# __slots__ is spelled out because the Lambda runtime predates dataclass(slots=True).
+@dataclass(frozen=True)
+class ProjectContext:
+    __slots__ = ("type", "estimated_users", "services_count", "complexity")
+    
+    type: str
+    estimated_users: int
+    services_count: int
+    complexity: str
+
+
+@dataclass(frozen=True)
+class Introduction:
+    __slots__ = ("title", "overview", "timeline", "difficulty", "estimated_cost", "cost_note")
+    
+    title: str
+    overview: str
+    timeline: str
+    difficulty: str
+    estimated_cost: str
+    cost_note: str
+
+
+@dataclass(frozen=True)
+class Architecture:
+    __slots__ = ("pattern", "services_count", "scalability", "services")
+    
+    pattern: str
+    services_count: int
+    scalability: str
+    services: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Phase:
+    __slots__ = ("name", "duration", "description", "steps")
     
-    project_type = classification.get("primary", "application")
-    features = classification.get("features", [])
+    name: str
+    duration: str
+    description: str
+    steps: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class GuideResult:
+    __slots__ = (
+        "format", "sections", "project_context", "introduction",
+        "prerequisites", "architecture", "next_steps", "phases"
+    )
+    
+    format: str
+    sections: int
+    project_context: ProjectContext
+    introduction: Introduction
+    prerequisites: Tuple[str, ...]
+    architecture: Architecture
+    next_steps: Tuple[str, ...]
+    phases: Tuple[Phase, ...]
+
+
+# Exclusive upper bounds of the user tiers indexing the tables below
+USER_TIER_BOUNDS = (1000, 10000)
+COST_TIERS = (
+    ("$0-50", "Can run mostly on AWS Free Tier"),
+    ("$50-200", "Some Free Tier benefits available"),
+    ("$200-1000", "Production-grade costs"),
+)
+
+# Per-service difficulty weight; the first matching keyword counts
+COMPLEXITY_WEIGHTS = (("cognito", 2), ("rds", 3), ("dynamodb", 1))
+
+SERVICE_KEYWORDS_RE = re.compile(r"lambda|cognito|rds|dynamodb|s3|api ?gateway")
+
+
+def _service_keywords(services: Sequence[str]) -> Set[str]:
+    """Service keywords found in any of the names, in a single regex pass"""
+    # Newline-separated so no keyword can match across two names
+    return set(SERVICE_KEYWORDS_RE.findall("\n".join(services).lower()))
+
+
+def generate_guide(services: List[str], classification: Classification, estimated_users: int) -> "GuideResult":
+    """Generate DYNAMIC implementation guide based on project specifics"""
+    return _generate_guide(tuple(services), classification.primary, estimated_users)
+
+
+@lru_cache(maxsize=256)
+def _generate_guide(services: Tuple[str, ...], project_type: str, estimated_users: int) -> "GuideResult":
+    users_display = f"{estimated_users:,}"
+    keywords = _service_keywords(services)
+    services_lower = [s.lower() for s in services]
     
     # Calculate complexity
     service_count = len(services)
@@ -20,130 +112,161 @@ def generate_guide(services: List[str], classification: Dict, estimated_users: i
     days = max(3, total_hours // 8)
     
     # Determine difficulty
-    complexity_score = sum([
-        2 if "cognito" in s.lower() else
-        3 if "rds" in s.lower() else
-        1 if "dynamodb" in s.lower() else 0
-        for s in services
-    ])
+    complexity_score = sum(
+        next((weight for keyword, weight in COMPLEXITY_WEIGHTS if keyword in s), 0)
+        for s in services_lower
+    )
     
     difficulty = "Beginner" if complexity_score < 2 else "Intermediate" if complexity_score < 4 else "Advanced"
     
     # Cost estimation
-    if estimated_users < 1000:
-        cost_range = "$0-50"
-        tier_message = "Can run mostly on AWS Free Tier"
-    elif estimated_users < 10000:
-        cost_range = "$50-200"
-        tier_message = "Some Free Tier benefits available"
-    else:
-        cost_range = "$200-1000"
-        tier_message = "Production-grade costs"
+    cost_range, tier_message = COST_TIERS[bisect_right(USER_TIER_BOUNDS, estimated_users)]
     
     # Build comprehensive guide
-    guide = {
-        "format": "dynamic_personalized",
-        "sections": len(services) + 6,
+    guide = GuideResult(
+        format="dynamic_personalized",
+        sections=len(services) + 6,
         
-        "project_context": {
-            "type": project_type,
-            "estimated_users": estimated_users,
-            "services_count": service_count,
-            "complexity": difficulty
-        },
+        project_context=ProjectContext(
+            type=project_type,
+            estimated_users=estimated_users,
+            services_count=service_count,
+            complexity=difficulty
+        ),
         
-        "introduction": {
-            "title": f"Building Your {project_type.title()} Platform on AWS",
-            "overview": f"Personalized implementation guide for a {project_type} application serving {estimated_users:,} users using {service_count} AWS services.",
-            "timeline": f"{total_hours}-{total_hours + 10} hours over {days}-{days + 2} days",
-            "difficulty": difficulty,
-            "estimated_cost": f"{cost_range}/month",
-            "cost_note": tier_message
-        },
+        introduction=Introduction(
+            title=f"Building Your {project_type.title()} Platform on AWS",
+            overview=f"Personalized implementation guide for a {project_type} application serving {users_display} users using {service_count} AWS services.",
+            timeline=f"{total_hours}-{total_hours + 10} hours over {days}-{days + 2} days",
+            difficulty=difficulty,
+            estimated_cost=f"{cost_range}/month",
+            cost_note=tier_message
+        ),
         
-        "prerequisites": [
+        prerequisites=(
             "AWS account with admin access",
             "AWS CLI installed and configured",
             "Basic knowledge of cloud architecture",
             f"Understanding of {project_type} applications"
-        ],
+        ),
         
-        "architecture": {
-            "pattern": "Serverless" if any("lambda" in s.lower() for s in services) else "Traditional",
-            "services_count": service_count,
-            "scalability": f"Designed for {estimated_users:,} users",
-            "services": services
-        },
+        architecture=Architecture(
+            pattern="Serverless" if "lambda" in keywords else "Traditional",
+            services_count=service_count,
+            scalability=f"Designed for {users_display} users",
+            services=services
+        ),
         
-        "next_steps": [
+        next_steps=(
             f"1. Set up AWS account with budget alert for {cost_range}",
             "2. Review prerequisites and gather tools",
             "3. Follow implementation phases in order",
             f"4. Test with {min(100, estimated_users // 10)} concurrent users",
             "5. Monitor CloudWatch metrics closely",
             "6. Scale gradually based on actual usage"
-        ],
+        ),
         
         # ✅ ADD PHASES HERE
-        "phases": generate_implementation_phases(services, project_type, estimated_users)
-    }
+        phases=tuple(generate_implementation_phases(keywords, project_type, estimated_users))
+    )
     
     return guide
 
 
-def generate_implementation_phases(services: List[str], project_type: str, users: int) -> List[Dict]:
-    """Generate implementation phases based on services"""
-    
-    phases = []
-    
-    # Phase 1: Foundation
-    phase1_tasks = [
+# Phases that don't depend on the services; shared by every guide
+FOUNDATION_PHASE = Phase(
+    name="Foundation Setup",
+    duration="2-3 hours",
+    description="Set up AWS account and basic infrastructure",
+    steps=(
         "Create AWS account or use existing",
         "Set up IAM users with MFA",
         "Configure AWS CLI",
         "Set up billing alerts"
-    ]
+    )
+)
+
+INTEGRATION_PHASE = Phase(
+    name="Integration & Testing",
+    duration="4-6 hours",
+    description="Connect all services and test end-to-end",
+    steps=(
+        "Connect Lambda to database",
+        "Test API endpoints",
+        "Set up CloudWatch logging",
+        "Configure error handling",
+        "Test authentication flow"
+    )
+)
+
+OPTIMIZATION_PHASE = Phase(
+    name="Performance Optimization",
+    duration="3-4 hours",
+    description="Optimize for scale and performance",
+    steps=(
+        "Enable CloudFront CDN",
+        "Configure caching",
+        "Set up auto-scaling",
+        "Optimize database queries",
+        "Enable X-Ray tracing"
+    )
+)
+
+DEPLOYMENT_PHASE = Phase(
+    name="Production Deployment",
+    duration="2-3 hours",
+    description="Deploy to production environment",
+    steps=(
+        "Set up CI/CD pipeline",
+        "Configure monitoring dashboards",
+        "Deploy to production",
+        "Run smoke tests",
+        "Monitor for 24 hours"
+    )
+)
+
+
+def generate_implementation_phases(keywords: Set[str], project_type: str, users: int) -> List[Phase]:
+    """Generate implementation phases from the services' keywords (see _service_keywords)"""
+    
+    phases = []
     
-    phases.append({
-        "name": "Foundation Setup",
-        "duration": "2-3 hours",
-        "description": "Set up AWS account and basic infrastructure",
-        "steps": phase1_tasks
-    })
+    # Phase 1: Foundation
+    phases.append(FOUNDATION_PHASE)
     
     # Phase 2: Core Services
     phase2_tasks = []
     
-    if any("cognito" in s.lower() for s in services):
+    if "cognito" in keywords:
         phase2_tasks.append("Set up Cognito user pool")
     
-    if any("dynamodb" in s.lower() for s in services):
+    if "dynamodb" in keywords:
         phase2_tasks.append("Create DynamoDB tables")
-    elif any("rds" in s.lower() for s in services):
+    elif "rds" in keywords:
         phase2_tasks.append("Set up RDS database")
     
-    if any("s3" in s.lower() for s in services):
+    if "s3" in keywords:
         phase2_tasks.append("Create S3 buckets with proper policies")
     
     if phase2_tasks:
-        phases.append({
-            "name": "Core Infrastructure",
-            "duration": "4-6 hours",
-            "description": "Set up database, storage, and authentication",
-            "steps": phase2_tasks
-        })
+        phases.append(Phase(
+            name="Core Infrastructure",
+            duration="4-6 hours",
+            description="Set up database, storage, and authentication",
+            steps=tuple(phase2_tasks)
+        ))
     
     # Phase 3: Compute & API
     phase3_tasks = []
     
-    if any("lambda" in s.lower() for s in services):
+    if "lambda" in keywords:
         phase3_tasks.extend([
             "Create Lambda functions",
             "Set up environment variables",
             "Configure IAM roles"
         ])
     
-    if any("apigateway" in s.lower() or "api gateway" in s.lower() for s in services):
+    if "apigateway" in keywords or "api gateway" in keywords:
         phase3_tasks.extend([
             "Create API Gateway",
             "Configure endpoints",
@@ -151,55 +274,22 @@ def generate_implementation_phases(services: List[str], project_type: str, users
         ])
     
     if phase3_tasks:
-        phases.append({
-            "name": "Compute & API Layer",
-            "duration": "6-8 hours",
-            "description": "Implement business logic and API endpoints",
-            "steps": phase3_tasks
-        })
+        phases.append(Phase(
+            name="Compute & API Layer",
+            duration="6-8 hours",
+            description="Implement business logic and API endpoints",
+            steps=tuple(phase3_tasks)
+        ))
     
     # Phase 4: Integration & Testing
-    phases.append({
-        "name": "Integration & Testing",
-        "duration": "4-6 hours",
-        "description": "Connect all services and test end-to-end",
-        "steps": [
-            "Connect Lambda to database",
-            "Test API endpoints",
-            "Set up CloudWatch logging",
-            "Configure error handling",
-            "Test authentication flow"
-        ]
-    })
+    phases.append(INTEGRATION_PHASE)
     
     # Phase 5: Optimization
     if users > 1000:
-        phases.append({
-            "name": "Performance Optimization",
-            "duration": "3-4 hours",
-            "description": "Optimize for scale and performance",
-            "steps": [
-                "Enable CloudFront CDN",
-                "Configure caching",
-                "Set up auto-scaling",
-                "Optimize database queries",
-                "Enable X-Ray tracing"
-            ]
-        })
+        phases.append(OPTIMIZATION_PHASE)
     
     # Phase 6: Deployment
-    phases.append({
-        "name": "Production Deployment",
-        "duration": "2-3 hours",
-        "description": "Deploy to production environment",
-        "steps": [
-            "Set up CI/CD pipeline",
-            "Configure monitoring dashboards",
-            "Deploy to production",
-            "Run smoke tests",
-            "Monitor for 24 hours"
-        ]
-    })
+    phases.append(DEPLOYMENT_PHASE)
     
     return phases
 
@@ -210,15 +300,16 @@ def get_troubleshooting_guide(services: List[str]) -> Dict[str, str]:
     guide = {
         "general": "Check CloudWatch Logs first. Enable X-Ray for tracing."
     }
+    keywords = _service_keywords(services)
     
-    if any("lambda" in s.lower() for s in services):
+    if "lambda" in keywords:
         guide["lambda_timeout"] = "Increase timeout or optimize code"
         guide["lambda_errors"] = "Check CloudWatch Logs for stack traces"
     
-    if any("dynamodb" in s.lower() for s in services):
+    if "dynamodb" in keywords:
         guide["dynamodb_throttling"] = "Increase capacity or enable auto-scaling"
     
-    if any("apigateway" in s.lower() for s in services):
+    if "apigateway" in keywords:
         guide["api_502"] = "Check Lambda integration and permissions"
     
     return guide
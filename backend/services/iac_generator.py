@@ -2,27 +2,29 @@
 Infrastructure as Code Generator
 Generates Terraform code WITHOUT modifying existing modules
 """
-from typing import Dict, List, Any
+from typing import Dict, Any, Sequence, Tuple
+from bisect import bisect_right
+from functools import lru_cache
 import logging
 
+from services.classifier import Classification
+from services.recommender import Recommendation
+
 logger = logging.getLogger(__name__)
 
+# Exclusive upper bounds of the user tiers indexing the tables below
+USER_TIER_BOUNDS = (1000, 10000)
+LAMBDA_SIZING = ((256, 10), (512, 30), (1024, 60))  # (memory MB, timeout s)
+DYNAMODB_BILLING = ("PAY_PER_REQUEST", "PAY_PER_REQUEST", "PROVISIONED")
+MONTHLY_COSTS = ("$0-25", "$25-100", "$100-500")
 
-def generate_iac(services: List[Dict], classification: Dict, estimated_users: int) -> Dict[str, Any]:
-    """Generate Terraform configuration for recommended architecture"""
-    
-    project_type = classification.get("primary", "application")
-    logger.info(f"Generating Terraform for {project_type}")
-    
-    return generate_terraform(services, project_type, estimated_users)
 
+def _user_tier(users: int) -> int:
+    return bisect_right(USER_TIER_BOUNDS, users)
 
-def generate_terraform(services: List[Dict], project_type: str, users: int) -> Dict[str, Any]:
-    """Generate complete Terraform configuration"""
-    
-    # Main configuration
-    main_tf = f"""# Terraform configuration for {project_type}
-# Estimated users: {users:,}
+
+MAIN_TERRAFORM_TEMPLATE = """# Terraform configuration for {project_type}
+# Estimated users: {users}
 
 terraform {{
   required_version = ">= 1.0"
@@ -46,8 +48,7 @@ provider "aws" {{
 }}
 """
 
-    # Variables
-    variables_tf = f"""variable "aws_region" {{
+VARIABLES_TERRAFORM_TEMPLATE = """variable "aws_region" {{
   description = "AWS region"
   type        = string
   default     = "us-east-1"
@@ -66,27 +67,7 @@ variable "project_name" {{
 }}
 """
 
-    # Generate resources for each service
-    resources = []
-    
-    for service in services:
-        service_lower = service["name"].lower()
-        
-        if "lambda" in service_lower:
-            resources.append(get_lambda_terraform(project_type, users))
-        elif "dynamodb" in service_lower:
-            resources.append(get_dynamodb_terraform(project_type, users))
-        elif "s3" in service_lower:
-            resources.append(get_s3_terraform(project_type))
-        elif "cognito" in service_lower:
-            resources.append(get_cognito_terraform(project_type))
-        elif "api gateway" in service_lower:
-            resources.append(get_apigateway_terraform(project_type))
-    
-    resources_tf = "\n\n".join(resources)
-    
-    # Outputs
-    outputs_tf = """output "api_endpoint" {
+OUTPUTS_TERRAFORM = """output "api_endpoint" {
   description = "API Gateway URL"
   value       = try(aws_api_gateway_deployment.main.invoke_url, "N/A")
 }
@@ -97,8 +78,8 @@ output "lambda_function" {
 }
 """
 
-    # Deployment instructions
-    readme = f"""# Terraform Deployment
+# Deployment instructions
+README_TEMPLATE = """# Terraform Deployment
 
 ## Prerequisites
 - Install Terraform: https://www.terraform.io/downloads
@@ -119,20 +100,73 @@ output "lambda_function" {
    terraform output
 
 ## Cost
-Estimated: ${get_monthly_cost(users)}/month for {users:,} users
+Estimated: ${monthly_cost}/month for {users} users
 
 ## Cleanup
 terraform destroy
 """
 
+
+def generate_iac(
+    services: Sequence[Recommendation],
+    classification: Classification,
+    estimated_users: int,
+    *,
+    include_docs: bool = True
+) -> Dict[str, Any]:
+    """Generate Terraform configuration for recommended architecture"""
+    
+    project_type = classification.primary
+    logger.info(f"Generating Terraform for {project_type}")
+    
+    return generate_terraform(
+        tuple(s.name for s in services), project_type, estimated_users, include_docs=include_docs
+    )
+
+
+@lru_cache(maxsize=256)
+def generate_terraform(
+    service_names: Tuple[str, ...],
+    project_type: str,
+    users: int,
+    *,
+    include_docs: bool = True
+) -> Dict[str, Any]:
+    """
+    Generate complete Terraform configuration (cached: treat the result as read-only)
+    
+    With include_docs=False only the .tf files are built: no README.md, no instructions.
+    """
+    users_display = f"{users:,}"
+    
+    main_tf = MAIN_TERRAFORM_TEMPLATE.format(project_type=project_type, users=users_display)
+    variables_tf = VARIABLES_TERRAFORM_TEMPLATE.format(project_type=project_type)
+    
+    # Generate resources for each service
+    resources = []
+    
+    for service_name in service_names:
+        service_lower = service_name.lower()
+        
+        for keyword, generator in TERRAFORM_GENERATORS:
+            if keyword in service_lower:
+                resources.append(generator(project_type, users))
+                break
+    
+    files = {
+        "main.tf": "\n\n".join([main_tf, *resources]),
+        "variables.tf": variables_tf,
+        "outputs.tf": OUTPUTS_TERRAFORM
+    }
+    
+    if not include_docs:
+        return {"format": "terraform", "files": files}
+    
+    files["README.md"] = README_TEMPLATE.format(monthly_cost=get_monthly_cost(users), users=users_display)
+    
     return {
         "format": "terraform",
-        "files": {
-            "main.tf": main_tf + "\n\n" + resources_tf,
-            "variables.tf": variables_tf,
-            "outputs.tf": outputs_tf,
-            "README.md": readme
-        },
+        "files": files,
         "instructions": [
             "1. Install Terraform",
             "2. Run: terraform init",
@@ -142,12 +176,7 @@ terraform destroy
     }
 
 
-def get_lambda_terraform(project: str, users: int) -> str:
-    """Generate Lambda Terraform"""
-    memory = 256 if users < 1000 else 512 if users < 10000 else 1024
-    timeout = 10 if users < 1000 else 30 if users < 10000 else 60
-    
-    return f"""resource "aws_lambda_function" "api" {{
+LAMBDA_TERRAFORM_TEMPLATE = """resource "aws_lambda_function" "api" {{
   filename      = "lambda.zip"
   function_name = "${{var.project_name}}-api"
   role          = aws_iam_role.lambda.arn
@@ -169,12 +198,7 @@ resource "aws_iam_role" "lambda" {{
   }})
 }}"""
 
-
-def get_dynamodb_terraform(project: str, users: int) -> str:
-    """Generate DynamoDB Terraform"""
-    billing = "PAY_PER_REQUEST" if users < 10000 else "PROVISIONED"
-    
-    return f"""resource "aws_dynamodb_table" "main" {{
+DYNAMODB_TERRAFORM_TEMPLATE = """resource "aws_dynamodb_table" "main" {{
   name         = "${{var.project_name}}-data"
   billing_mode = "{billing}"
   hash_key     = "pk"
@@ -194,10 +218,7 @@ def get_dynamodb_terraform(project: str, users: int) -> str:
   }}
 }}"""
 
-
-def get_s3_terraform(project: str) -> str:
-    """Generate S3 Terraform"""
-    return """resource "aws_s3_bucket" "main" {
+S3_TERRAFORM = """resource "aws_s3_bucket" "main" {
   bucket = "${var.project_name}-storage"
 }
 
@@ -208,10 +229,7 @@ resource "aws_s3_bucket_versioning" "main" {
   }
 }"""
 
-
-def get_cognito_terraform(project: str) -> str:
-    """Generate Cognito Terraform"""
-    return """resource "aws_cognito_user_pool" "main" {
+COGNITO_TERRAFORM = """resource "aws_cognito_user_pool" "main" {
   name = "${var.project_name}-users"
   
   password_policy {
@@ -222,10 +240,7 @@ def get_cognito_terraform(project: str) -> str:
   }
 }"""
 
-
-def get_apigateway_terraform(project: str) -> str:
-    """Generate API Gateway Terraform"""
-    return """resource "aws_api_gateway_rest_api" "main" {
+APIGATEWAY_TERRAFORM = """resource "aws_api_gateway_rest_api" "main" {
   name = "${var.project_name}-api"
 }
 
@@ -235,11 +250,45 @@ resource "aws_api_gateway_deployment" "main" {
 }"""
 
 
+def get_lambda_terraform(project: str, users: int) -> str:
+    """Generate Lambda Terraform"""
+    memory, timeout = LAMBDA_SIZING[_user_tier(users)]
+    
+    return LAMBDA_TERRAFORM_TEMPLATE.format(memory=memory, timeout=timeout)
+
+
+def get_dynamodb_terraform(project: str, users: int) -> str:
+    """Generate DynamoDB Terraform"""
+    billing = DYNAMODB_BILLING[_user_tier(users)]
+    
+    return DYNAMODB_TERRAFORM_TEMPLATE.format(billing=billing)
+
+
+def get_s3_terraform(project: str) -> str:
+    """Generate S3 Terraform"""
+    return S3_TERRAFORM
+
+
+def get_cognito_terraform(project: str) -> str:
+    """Generate Cognito Terraform"""
+    return COGNITO_TERRAFORM
+
+
+def get_apigateway_terraform(project: str) -> str:
+    """Generate API Gateway Terraform"""
+    return APIGATEWAY_TERRAFORM
+
+
+# Service name keyword -> resource generator; first match wins
+TERRAFORM_GENERATORS = (
+    ("lambda", get_lambda_terraform),
+    ("dynamodb", get_dynamodb_terraform),
+    ("s3", lambda project, users: get_s3_terraform(project)),
+    ("cognito", lambda project, users: get_cognito_terraform(project)),
+    ("api gateway", lambda project, users: get_apigateway_terraform(project)),
+)
+
+
 def get_monthly_cost(users: int) -> str:
     """Estimate cost"""
-    if users < 1000:
-        return "$0-25"
-    elif users < 10000:
-        return "$25-100"
-    else:
-        return "$100-500"
+    return MONTHLY_COSTS[_user_tier(users)]
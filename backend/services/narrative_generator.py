@@ -2,104 +2,90 @@
 Narrative Generator - PROFESSIONAL EDITION with FULL CONTENT
 Generates comprehensive, Solutions Architect-level analysis with detailed explanations
 """
-from typing import Dict, List, Any
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Sequence
 import logging
+import re
+
+from services.classifier import Classification
+from services.guide_generator import GuideResult
+from services.recommender import Recommendation
 
 logger = logging.getLogger(__name__)
 
 
-def generate_narrative_analysis(
-    services: List[Dict],
-    classification: Dict,
-    cost_analysis: Dict,
-    implementation_guide: Dict,
-    estimated_users: int
-) -> str:
-    """
-    Generate comprehensive narrative analysis with professional insights
-    """
-    
-    project_type = classification.get("primary", "application")
-    confidence = classification.get("confidence", 0.8)
-    features = classification.get("features", [])
-    
-    # Generate complete narrative HTML with FULL content
-    narrative = generate_executive_summary(project_type, estimated_users, confidence, features)
-    narrative += generate_architecture_overview(services, project_type, estimated_users)
-    narrative += generate_cost_narrative(cost_analysis, services, estimated_users)
-    narrative += generate_implementation_narrative(implementation_guide, services, project_type)
-    narrative += generate_best_practices(services, project_type, estimated_users)
-    narrative += generate_conclusion(project_type, estimated_users)
-    
-    return narrative
+PROJECT_DESCRIPTIONS = {
+    "ecommerce": {
+        "title": "E-Commerce Platform",
+        "full_description": "an e-commerce platform requiring secure payment processing, real-time inventory management, and scalable user authentication",
+        "business_impact": "This architecture enables you to handle transactions securely, manage product catalogs efficiently, and scale seamlessly as your customer base grows. The serverless approach means you only pay for actual usage, making it cost-effective for startups and established businesses alike."
+    },
+    "api": {
+        "title": "API Service",
+        "full_description": "a RESTful API service requiring high availability, efficient data access, and comprehensive API management",
+        "business_impact": "This architecture provides enterprise-grade API capabilities with built-in throttling, caching, and monitoring. Your API will be able to serve thousands of requests per second while maintaining sub-100ms response times."
+    },
+    "social": {
+        "title": "Social Media Platform",
+        "full_description": "a social networking application with real-time interactions, media storage, and complex user relationship management",
+        "business_impact": "This architecture supports viral growth with auto-scaling capabilities and global content delivery. Users worldwide will experience fast load times, and your platform can handle sudden traffic spikes during trending events."
+    },
+    "saas": {
+        "title": "SaaS Application",
+        "full_description": "a multi-tenant SaaS solution requiring secure data isolation, subscription management, and reliable infrastructure",
+        "business_impact": "This architecture ensures enterprise-grade security with tenant isolation, 99.99% uptime, and the ability to onboard new customers instantly without infrastructure changes."
+    },
+    "web_application": {
+        "title": "Web Application",
+        "full_description": "a cloud-based web application requiring scalable infrastructure and reliable performance",
+        "business_impact": "This architecture provides a solid foundation for your web application with automatic scaling, high availability, and cost optimization built in from day one."
+    }
+}
 
+SCALE_BOUNDS = (1000, 50000)
+SCALE_CATEGORIES = ("Small Scale", "Medium Scale", "Large Scale")
 
-def generate_executive_summary(project_type: str, users: int, confidence: float, features: List) -> str:
-    """Executive-level project summary with detailed context"""
-    
-    project_descriptions = {
-        "ecommerce": {
-            "title": "E-Commerce Platform",
-            "full_description": "an e-commerce platform requiring secure payment processing, real-time inventory management, and scalable user authentication",
-            "business_impact": "This architecture enables you to handle transactions securely, manage product catalogs efficiently, and scale seamlessly as your customer base grows. The serverless approach means you only pay for actual usage, making it cost-effective for startups and established businesses alike."
-        },
-        "api": {
-            "title": "API Service",
-            "full_description": "a RESTful API service requiring high availability, efficient data access, and comprehensive API management",
-            "business_impact": "This architecture provides enterprise-grade API capabilities with built-in throttling, caching, and monitoring. Your API will be able to serve thousands of requests per second while maintaining sub-100ms response times."
-        },
-        "social": {
-            "title": "Social Media Platform",
-            "full_description": "a social networking application with real-time interactions, media storage, and complex user relationship management",
-            "business_impact": "This architecture supports viral growth with auto-scaling capabilities and global content delivery. Users worldwide will experience fast load times, and your platform can handle sudden traffic spikes during trending events."
-        },
-        "saas": {
-            "title": "SaaS Application",
-            "full_description": "a multi-tenant SaaS solution requiring secure data isolation, subscription management, and reliable infrastructure",
-            "business_impact": "This architecture ensures enterprise-grade security with tenant isolation, 99.99% uptime, and the ability to onboard new customers instantly without infrastructure changes."
-        },
-        "web_application": {
-            "title": "Web Application",
-            "full_description": "a cloud-based web application requiring scalable infrastructure and reliable performance",
-            "business_impact": "This architecture provides a solid foundation for your web application with automatic scaling, high availability, and cost optimization built in from day one."
-        }
-    }
-    
-    project_info = project_descriptions.get(project_type, project_descriptions["web_application"])
-    scale_category = "Small Scale" if users < 1000 else "Medium Scale" if users < 50000 else "Large Scale"
-    
-    confidence_text = "highly confident" if confidence > 0.8 else "confident" if confidence > 0.6 else "reasonably sure"
-    
-    return f"""
+# Confidence must be strictly above a bound to move up a level (bisect_left)
+CONFIDENCE_BOUNDS = (0.6, 0.8)
+CONFIDENCE_TEXTS = ("reasonably sure", "confident", "highly confident")
+
+# Two-stage template: single-brace fields are baked in per (project type, scale)
+# at import, double-brace fields are filled in per request
+EXECUTIVE_SUMMARY_TEMPLATE = """
     <section class="narrative-section executive-summary">
         <h2>📊 Executive Summary</h2>
         
         <div class="summary-grid">
             <div class="summary-card">
                 <h4>Project Type</h4>
-                <p><strong>{project_info['title']}</strong></p>
+                <p><strong>{title}</strong></p>
             </div>
             <div class="summary-card">
                 <h4>Scale</h4>
-                <p><strong>{scale_category}</strong> ({users:,} users)</p>
+                <p><strong>{scale_category}</strong> ({{users}} users)</p>
             </div>
             <div class="summary-card">
                 <h4>Confidence</h4>
-                <p><strong>{confidence*100:.0f}%</strong></p>
+                <p><strong>{{confidence_pct}}%</strong></p>
             </div>
         </div>
         
         <div class="overview-text">
             <p>
-                Based on my analysis of your project description, I'm <strong>{confidence_text}</strong> that you're building 
-                <strong>{project_info['full_description']}</strong>.
+                Based on my analysis of your project description, I'm <strong>{{confidence_text}}</strong> that you're building 
+                <strong>{full_description}</strong>.
             </p>
             
-            {f'<p>I identified the following key features in your project: <strong>{", ".join(features[:5])}</strong>. These features directly influenced my service recommendations and architecture decisions.</p>' if features else ''}
+            {{features_html}}
             
             <p>
-                Your architecture is designed to support <strong>{users:,} concurrent users</strong> efficiently. 
-                {project_info['business_impact']}
+                Your architecture is designed to support <strong>{{users}} concurrent users</strong> efficiently. 
+                {business_impact}
             </p>
             
             <p>
@@ -112,99 +98,87 @@ def generate_executive_summary(project_type: str, users: int, confidence: float,
             <p>
                 <strong>What makes this architecture special:</strong> Every service recommendation is specifically chosen 
                 for your use case. This isn't a one-size-fits-all template—it's a tailored solution that balances 
-                performance, cost, and operational complexity based on your {users:,} user scale.
+                performance, cost, and operational complexity based on your {{users}} user scale.
             </p>
         </div>
     </section>
     """
 
+FEATURES_TEMPLATE = '<p>I identified the following key features in your project: <strong>{features}</strong>. These features directly influenced my service recommendations and architecture decisions.</p>'
 
-def generate_architecture_overview(services: List[Dict], project_type: str, users: int) -> str:
-    """Detailed architecture analysis with technical reasoning"""
-    
-    intro_by_type = {
-        "ecommerce": "For an e-commerce platform, reliability and security are paramount. Every service in this architecture has been selected to ensure your customers have a seamless shopping experience while their payment information remains secure. Let me explain each component and why it's essential.",
-        "api": "For an API service, performance and scalability are critical. This architecture is designed to handle high request volumes with low latency while providing the monitoring and security features you need for production.",
-        "social": "For a social platform, real-time capabilities and media handling are crucial. This architecture provides the infrastructure to support viral growth and global reach.",
-        "saas": "For a SaaS application, multi-tenancy and data isolation are fundamental. This architecture ensures each customer's data remains secure while allowing you to scale efficiently.",
-        "web_application": "For your web application, we've focused on building a scalable, maintainable foundation that can grow with your needs."
-    }
-    
-    intro = intro_by_type.get(project_type, intro_by_type["web_application"])
-    
-    html = f"""
-    <section class="narrative-section architecture-deep-dive">
-        <h2>🏗️ Architecture Deep Dive</h2>
-        
-        <p class="section-intro">
-            {intro}
-        </p>
-        
-        <p class="section-intro">
-            <strong>Architectural Philosophy:</strong> This design prioritizes <em>serverless-first</em> wherever possible 
-            to minimize operational overhead and maximize scalability. You won't be managing servers, patching operating 
-            systems, or worrying about capacity planning. AWS handles the undifferentiated heavy lifting while you focus 
-            on building your application.
-        </p>
-    """
-    
-    for i, service in enumerate(services, 1):
-        name = service.get('name', 'Service')
-        category = service.get('category', 'service')
-        why_needed = service.get('why_needed', '')
-        use_case = service.get('use_case_example', '')
-        typical_cost = service.get('typical_monthly', '$0-50')
-        
-        # Generate rich technical context
-        technical_context = get_service_technical_context(name, users, project_type)
-        
-        html += f"""
+EXECUTIVE_SUMMARY_TEMPLATES = {
+    (project_type, scale_category): EXECUTIVE_SUMMARY_TEMPLATE.format(scale_category=scale_category, **info)
+    for project_type, info in PROJECT_DESCRIPTIONS.items()
+    for scale_category in SCALE_CATEGORIES
+}
+
+ARCHITECTURE_INTROS = {
+    "ecommerce": "For an e-commerce platform, reliability and security are paramount. Every service in this architecture has been selected to ensure your customers have a seamless shopping experience while their payment information remains secure. Let me explain each component and why it's essential.",
+    "api": "For an API service, performance and scalability are critical. This architecture is designed to handle high request volumes with low latency while providing the monitoring and security features you need for production.",
+    "social": "For a social platform, real-time capabilities and media handling are crucial. This architecture provides the infrastructure to support viral growth and global reach.",
+    "saas": "For a SaaS application, multi-tenancy and data isolation are fundamental. This architecture ensures each customer's data remains secure while allowing you to scale efficiently.",
+    "web_application": "For your web application, we've focused on building a scalable, maintainable foundation that can grow with your needs."
+}
+
+
+# Fields read from each recommended service
+SERVICE_FIELDS = attrgetter("name", "category", "why_needed", "use_case_example", "typical_monthly")
+
+# Per-service block of the architecture deep dive, filled with format_map
+SERVICE_BLOCK_TEMPLATE = """
         <div class="service-detail">
-            <h3>{i}. {name}</h3>
+            <h3>{idx}. {name}</h3>
             <span class="category-badge">{category}</span>
             
             <div class="service-why">
                 <h4>🎯 Why {name}?</h4>
                 <p>{why_needed}</p>
                 <p style="margin-top: 10px; color: #4a5568; font-style: italic;">
-                    {technical_context['strategic_reason']}
+                    {strategic_reason}
                 </p>
             </div>
             
-            {f'''
-            <div class="service-usage">
-                <h4>💼 In Your Application</h4>
-                <p>{use_case}</p>
-                <p style="margin-top: 10px; color: #4a5568;">
-                    <strong>Real-world example:</strong> {technical_context['real_world_example']}
-                </p>
-            </div>
-            ''' if use_case else ''}
+            {usage}
             
             <div class="technical-specs">
-                <h4>⚙️ Technical Configuration for {users:,} Users</h4>
-                {technical_context['configuration']}
+                <h4>⚙️ Technical Configuration for {users} Users</h4>
+                {configuration}
             </div>
             
             <div class="service-cost">
                 <h4>💰 Cost Analysis</h4>
                 <p>
-                    <strong>Estimated cost: {typical_cost}/month</strong> based on {users:,} concurrent users 
+                    <strong>Estimated cost: {typical_cost}/month</strong> based on {users} concurrent users 
                     with typical usage patterns.
                 </p>
                 <p style="margin-top: 8px; font-size: 0.9em; color: #718096;">
-                    {technical_context['cost_explanation']}
+                    {cost_explanation}
                 </p>
             </div>
             
             <div class="service-alternatives">
                 <h4>🔄 Why Not Alternative Solutions?</h4>
-                <p>{technical_context['alternatives']}</p>
+                <p>{alternatives}</p>
             </div>
         </div>
         """
-    
-    html += """
+
+SERVICE_USAGE_TEMPLATE = """
+            <div class="service-usage">
+                <h4>💼 In Your Application</h4>
+                <p>{use_case}</p>
+                <p style="margin-top: 10px; color: #4a5568;">
+                    <strong>Real-world example:</strong> {real_world_example}
+                </p>
+            </div>
+            """
+
+# The usage block is optional, so both variants are assembled up front
+SERVICE_BLOCK_WITH_USAGE = SERVICE_BLOCK_TEMPLATE.replace("{usage}", SERVICE_USAGE_TEMPLATE)
+SERVICE_BLOCK_WITHOUT_USAGE = SERVICE_BLOCK_TEMPLATE.replace("{usage}", "")
+
+# Closing summary of the architecture deep dive (same for every project)
+ARCHITECTURE_SUMMARY = """
         <div class="architecture-summary">
             <h4>🔗 How These Services Work Together</h4>
             <p>
@@ -224,21 +198,166 @@ def generate_architecture_overview(services: List[Dict], project_type: str, user
         </div>
     </section>
     """
+
+
+def generate_narrative_analysis(
+    services: Sequence[Recommendation],
+    classification: Classification,
+    cost_analysis: dict,
+    implementation_guide: GuideResult,
+    estimated_users: int
+) -> str:
+    """
+    Generate comprehensive narrative analysis with professional insights
+    """
     
-    return html
+    project_type = classification.primary
+    confidence = classification.confidence
+    features = classification.features
+    
+    # Generate complete narrative HTML with FULL content
+    parts = [
+        generate_executive_summary(project_type, estimated_users, confidence, features),
+        generate_architecture_overview(services, project_type, estimated_users),
+        generate_cost_narrative(cost_analysis, services, estimated_users),
+        generate_implementation_narrative(implementation_guide, services, project_type),
+        generate_best_practices(services, project_type, estimated_users),
+        generate_conclusion(project_type, estimated_users),
+    ]
+    
+    return "".join(parts)
 
 
-def get_service_technical_context(service_name: str, users: int, project_type: str) -> Dict[str, str]:
-    """Get rich technical context for each service"""
+def generate_executive_summary(project_type: str, users: int, confidence: float, features: tuple[str, ...]) -> str:
+    """Executive-level project summary with detailed context"""
+    
+    scale_category = SCALE_CATEGORIES[bisect_right(SCALE_BOUNDS, users)]
+    template = EXECUTIVE_SUMMARY_TEMPLATES.get(
+        (project_type, scale_category),
+        EXECUTIVE_SUMMARY_TEMPLATES[("web_application", scale_category)]
+    )
+    
+    confidence_text = CONFIDENCE_TEXTS[bisect_left(CONFIDENCE_BOUNDS, confidence)]
+    if features:
+        shown = features if len(features) <= 5 else features[:5]
+        features_html = FEATURES_TEMPLATE.format(features=", ".join(shown))
+    else:
+        features_html = ''
+    
+    return template.format(
+        users=format(users, ','),
+        confidence_pct=format(confidence * 100, '.0f'),
+        confidence_text=confidence_text,
+        features_html=features_html
+    )
+
+
+def generate_architecture_overview(services: Sequence[Recommendation], project_type: str, users: int) -> str:
+    """Detailed architecture analysis with technical reasoning"""
+    
+    intro = ARCHITECTURE_INTROS.get(project_type, ARCHITECTURE_INTROS["web_application"])
+    
+    chunks = [f"""
+    <section class="narrative-section architecture-deep-dive">
+        <h2>🏗️ Architecture Deep Dive</h2>
+        
+        <p class="section-intro">
+            {intro}
+        </p>
+        
+        <p class="section-intro">
+            <strong>Architectural Philosophy:</strong> This design prioritizes <em>serverless-first</em> wherever possible 
+            to minimize operational overhead and maximize scalability. You won't be managing servers, patching operating 
+            systems, or worrying about capacity planning. AWS handles the undifferentiated heavy lifting while you focus 
+            on building your application.
+        </p>
+    """]
     
-    # Normalize service name: "Amazon DynamoDB" -> "DynamoDB", "AWS Lambda" -> "Lambda"
-    normalized_name = service_name.replace("Amazon ", "").replace("AWS ", "").replace("Amazon", "").replace("AWS", "").strip()
+    users_fmt = format(users, ',')
+    for i, service in enumerate(services, 1):
+        name, category, why_needed, use_case, typical_cost = SERVICE_FIELDS(service)
+        
+        # Generate rich technical context
+        technical_context = get_service_technical_context(name, users, project_type)
+        
+        template = SERVICE_BLOCK_WITH_USAGE if use_case else SERVICE_BLOCK_WITHOUT_USAGE
+        chunks.append(template.format_map({
+            "idx": i,
+            "name": name,
+            "category": category,
+            "why_needed": why_needed,
+            "use_case": use_case,
+            "real_world_example": technical_context.real_world_example,
+            "typical_cost": typical_cost,
+            "users": users_fmt,
+            "strategic_reason": technical_context.strategic_reason,
+            "configuration": technical_context.configuration,
+            "cost_explanation": technical_context.cost_explanation,
+            "alternatives": technical_context.alternatives,
+        }))
     
-    contexts = {
-        "Lambda": {
-            "strategic_reason": "Lambda is the cornerstone of modern serverless architecture. By eliminating server management, you can deploy code in minutes rather than days. It automatically scales from zero to thousands of concurrent executions, and you only pay for the compute time you consume—down to the millisecond.",
-            "real_world_example": "When a user clicks 'Checkout,' Lambda processes the order, validates inventory, charges the payment method, sends confirmation emails, and updates the database—all in under 500ms. If you suddenly get featured on TechCrunch and traffic spikes 100x, Lambda automatically scales to handle it.",
-            "configuration": f"""
+    chunks.append(ARCHITECTURE_SUMMARY)
+    return "".join(chunks)
+
+
+@dataclass(frozen=True)
+class ServiceContext:
+    """Technical context rendered for one service in the architecture deep dive"""
+    __slots__ = ("strategic_reason", "real_world_example", "configuration", "cost_explanation", "alternatives")
+    
+    strategic_reason: str
+    real_world_example: str
+    configuration: str
+    cost_explanation: str
+    alternatives: str
+
+
+# User-independent parts of each service context; the builders below add the
+# configuration and cost text for a given user count
+SERVICE_CONTEXT_TEXT = {
+    "Lambda": {
+        "strategic_reason": "Lambda is the cornerstone of modern serverless architecture. By eliminating server management, you can deploy code in minutes rather than days. It automatically scales from zero to thousands of concurrent executions, and you only pay for the compute time you consume—down to the millisecond.",
+        "real_world_example": "When a user clicks 'Checkout,' Lambda processes the order, validates inventory, charges the payment method, sends confirmation emails, and updates the database—all in under 500ms. If you suddenly get featured on TechCrunch and traffic spikes 100x, Lambda automatically scales to handle it.",
+        "alternatives": "EC2 would require you to provision, patch, and monitor servers 24/7, costing $50+ even when idle. Fargate is great for long-running containers but overkill for request-response patterns. App Runner works well but offers less fine-grained control than Lambda."
+    },
+    "DynamoDB": {
+        "strategic_reason": "DynamoDB provides single-digit millisecond performance at any scale without operational overhead. There's no database to tune, no indexes to rebalance, and no capacity to pre-provision. It's designed for applications that need consistent, fast data access as they grow from thousands to millions of users.",
+        "real_world_example": "Your product catalog needs to load in under 50ms even during Black Friday sales. DynamoDB's in-memory caching (DAX) can serve millions of reads per second. When a user updates their cart, the change is immediately consistent across all sessions.",
+        "alternatives": "RDS would work but requires instance sizing, backup management, and read replica configuration. Aurora Serverless v2 is excellent for complex queries but costs 5-10x more than DynamoDB for key-value access patterns. MongoDB Atlas is powerful but adds another vendor and additional operational complexity."
+    },
+    "S3": {
+        "strategic_reason": "S3 is the most cost-effective and durable object storage available. With 99.999999999% (11 nines) durability, your data is safer in S3 than on any disk you could buy. It scales infinitely, costs pennies per GB, and integrates seamlessly with CloudFront for global content delivery.",
+        "real_world_example": "User profile pictures, product images, invoices, and backups all go in S3. With lifecycle policies, files automatically move to cheaper storage tiers after 90 days. When integrated with CloudFront, images load in under 50ms worldwide.",
+        "alternatives": "EFS costs 10x more and is designed for shared file systems, not object storage. EBS is block storage for EC2 instances. Third-party services like Cloudinary add cost for features you can build with S3 + Lambda. S3 is purpose-built for this use case."
+    },
+    "API Gateway": {
+        "strategic_reason": "API Gateway is AWS's managed API solution, handling billions of requests daily for companies like Netflix and Airbnb. It provides DDoS protection, request throttling, caching, and monitoring out of the box—features that would take months to build yourself.",
+        "real_world_example": "Every API call to your application goes through API Gateway. It authenticates requests using Cognito tokens, applies rate limiting (1000 req/sec per client), caches GET responses for 5 minutes, and logs everything to CloudWatch for debugging.",
+        "alternatives": "ALB + EC2 would require managing load balancers and servers. Kong/Apigee are powerful but add complexity and cost. CloudFront Functions can handle simple routing but lack API Gateway's request validation and transformation capabilities."
+    },
+    "Cognito": {
+        "strategic_reason": "Cognito provides enterprise-grade authentication without the security risks of building it yourself. It handles OAuth, SAML, social login, MFA, and compromised credential detection—features that would take months to implement securely.",
+        "real_world_example": "Users sign up with email/password or social accounts (Google, Facebook). Cognito handles email verification, password resets, and MFA. JWT tokens authenticate API requests. If a password appears in a breach database, Cognito automatically locks the account.",
+        "alternatives": "Auth0 costs $240/month minimum for production features. Okta starts at $2-5 per MAU. Firebase Auth works but locks you into Google's ecosystem. Building your own auth means risking security breaches and maintaining complex code forever."
+    },
+    "CloudFront": {
+        "strategic_reason": "CloudFront is AWS's global CDN with 400+ edge locations worldwide. It dramatically reduces latency for global users by caching content near them. A user in Tokyo loads images in 50ms instead of 500ms by fetching from a nearby edge location.",
+        "real_world_example": "Product images, CSS, JavaScript, and API responses (for GET requests) are cached at edge locations. The first user in Singapore fetches from S3 (~200ms). The next 10,000 users load from the Singapore edge in 20ms. This reduces S3 costs by 80% and improves user experience.",
+        "alternatives": "Cloudflare is good but adds another vendor. Fastly is powerful but expensive for smaller workloads. CloudFront integrates seamlessly with S3 and API Gateway, simplifying architecture."
+    },
+    "SES": {
+        "strategic_reason": "SES is AWS's email service, capable of sending millions of emails reliably. Unlike SendGrid or Mailgun, SES costs $0.10 per 1,000 emails with no monthly minimum. For transactional emails, it's unbeatable on price and reliability.",
+        "real_world_example": "Order confirmations, password resets, shipping notifications, and weekly newsletters all use SES. With proper DKIM/SPF setup, your emails reach inboxes, not spam folders. SES handles bounce and complaint processing automatically.",
+        "alternatives": "SendGrid, Mailgun, and Postmark are easier to start with (no sandbox restrictions) but cost 10-20x more at scale. For transactional emails, SES is the industry standard for cost-effectiveness."
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _lambda_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["Lambda"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Memory:</strong> {512 if users < 10000 else 1024}MB (optimal for your scale)</li>
                     <li><strong>Timeout:</strong> 30 seconds (adjustable per function)</li>
@@ -251,17 +370,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     Lambda can handle this effortlessly with its default concurrency limits.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0/month - FREE TIER covers 1M requests + 400,000 GB-seconds compute monthly<br>
                 <strong>After Year 1:</strong> ${max(10, users*50*0.0000002*720):.2f}-${max(50, users*100*0.0000002*720):.2f}/month based on {users*50:,}-{users*100:,} requests/day<br>
                 <em style="color: #718096;">Pricing: $0.20 per 1M requests + $0.0000166667 per GB-second</em>
-            """,
-            "alternatives": "EC2 would require you to provision, patch, and monitor servers 24/7, costing $50+ even when idle. Fargate is great for long-running containers but overkill for request-response patterns. App Runner works well but offers less fine-grained control than Lambda."
-        },
-        "DynamoDB": {
-            "strategic_reason": "DynamoDB provides single-digit millisecond performance at any scale without operational overhead. There's no database to tune, no indexes to rebalance, and no capacity to pre-provision. It's designed for applications that need consistent, fast data access as they grow from thousands to millions of users.",
-            "real_world_example": "Your product catalog needs to load in under 50ms even during Black Friday sales. DynamoDB's in-memory caching (DAX) can serve millions of reads per second. When a user updates their cart, the change is immediately consistent across all sessions.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _dynamodb_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["DynamoDB"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Capacity Mode:</strong> {"On-Demand (pay per request)" if users < 10000 else "Provisioned with auto-scaling"}</li>
                     <li><strong>Expected RCU:</strong> ~{max(5, users//100)} per second during normal operation</li>
@@ -273,17 +394,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     {"On-demand mode is perfect for your scale—no capacity planning needed. You'll pay only for actual reads/writes." if users < 10000 else "At your scale, provisioned capacity with auto-scaling offers 30% cost savings compared to on-demand."}
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0-${max(5, users*0.001):.2f}/month - FREE TIER covers 25GB storage + 200M requests/month<br>
                 <strong>After Year 1:</strong> ${max(5, users*10*30*0.25/1000000):.2f}-${max(30, users*10*30*0.25/1000000*3):.2f}/month for {users:,} users<br>
                 <em style="color: #718096;">On-demand: $0.25 per million reads, $1.25 per million writes</em>
-            """,
-            "alternatives": "RDS would work but requires instance sizing, backup management, and read replica configuration. Aurora Serverless v2 is excellent for complex queries but costs 5-10x more than DynamoDB for key-value access patterns. MongoDB Atlas is powerful but adds another vendor and additional operational complexity."
-        },
-        "S3": {
-            "strategic_reason": "S3 is the most cost-effective and durable object storage available. With 99.999999999% (11 nines) durability, your data is safer in S3 than on any disk you could buy. It scales infinitely, costs pennies per GB, and integrates seamlessly with CloudFront for global content delivery.",
-            "real_world_example": "User profile pictures, product images, invoices, and backups all go in S3. With lifecycle policies, files automatically move to cheaper storage tiers after 90 days. When integrated with CloudFront, images load in under 50ms worldwide.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _s3_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["S3"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Storage Class:</strong> S3 Standard for active data, S3 Intelligent-Tiering for varied access patterns</li>
                     <li><strong>Expected Storage:</strong> ~{users*5}MB initially ({users*0.005:.1f}GB)</li>
@@ -295,17 +418,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     S3's pricing starts at $0.023/GB for the first 50TB. For {users:,} users, your initial storage costs will be under $1/month, even with generous file storage per user.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0/month - FREE TIER covers 5GB storage + 20K GET + 2K PUT requests monthly<br>
                 <strong>After Year 1:</strong> ${max(1, users*0.005*0.023):.2f}-${max(20, users*0.01*0.023):.2f}/month for storage + requests<br>
                 <em style="color: #718096;">Storage: $0.023/GB, GET: $0.0004/1K requests, PUT: $0.005/1K requests</em>
-            """,
-            "alternatives": "EFS costs 10x more and is designed for shared file systems, not object storage. EBS is block storage for EC2 instances. Third-party services like Cloudinary add cost for features you can build with S3 + Lambda. S3 is purpose-built for this use case."
-        },
-        "API Gateway": {
-            "strategic_reason": "API Gateway is AWS's managed API solution, handling billions of requests daily for companies like Netflix and Airbnb. It provides DDoS protection, request throttling, caching, and monitoring out of the box—features that would take months to build yourself.",
-            "real_world_example": "Every API call to your application goes through API Gateway. It authenticates requests using Cognito tokens, applies rate limiting (1000 req/sec per client), caches GET responses for 5 minutes, and logs everything to CloudWatch for debugging.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _api_gateway_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["API Gateway"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>API Type:</strong> REST API (HTTP API for simpler use cases saves 70% on costs)</li>
                     <li><strong>Expected Requests:</strong> ~{users*100:,} per day</li>
@@ -317,17 +442,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     API Gateway's default limits handle {users:,} users comfortably. The 1000 req/sec throttle protects your backend from runaway requests or DDoS attacks.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0/month - FREE TIER covers 1M API calls monthly<br>
                 <strong>After Year 1:</strong> ${max(3, (users*100*30/1000000)*3.5):.2f}-${max(30, (users*200*30/1000000)*3.5):.2f}/month<br>
                 <em style="color: #718096;">REST API: $3.50 per million requests. HTTP API: $1.00 per million (consider if features allow)</em>
-            """,
-            "alternatives": "ALB + EC2 would require managing load balancers and servers. Kong/Apigee are powerful but add complexity and cost. CloudFront Functions can handle simple routing but lack API Gateway's request validation and transformation capabilities."
-        },
-        "Cognito": {
-            "strategic_reason": "Cognito provides enterprise-grade authentication without the security risks of building it yourself. It handles OAuth, SAML, social login, MFA, and compromised credential detection—features that would take months to implement securely.",
-            "real_world_example": "Users sign up with email/password or social accounts (Google, Facebook). Cognito handles email verification, password resets, and MFA. JWT tokens authenticate API requests. If a password appears in a breach database, Cognito automatically locks the account.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _cognito_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["Cognito"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Monthly Active Users:</strong> Estimated {users} MAUs</li>
                     <li><strong>MFA:</strong> Optional SMS or TOTP-based (highly recommended)</li>
@@ -339,17 +466,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     Cognito's free tier covers 50,000 MAUs. Beyond that, pricing is $0.0055 per MAU, making it extremely cost-effective compared to Auth0 or building your own.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 50,000 MAUs:</strong> Always FREE (not just first year!)<br>
                 <strong>Your scale ({users} users):</strong> {"$0/month - within free tier!" if users <= 50000 else f"${(users-50000)*0.0055:.2f}/month for users beyond 50K"}<br>
                 <em style="color: #718096;">After 50K MAUs: $0.0055 per additional MAU. Way cheaper than Auth0 ($240/month minimum)!</em>
-            """,
-            "alternatives": "Auth0 costs $240/month minimum for production features. Okta starts at $2-5 per MAU. Firebase Auth works but locks you into Google's ecosystem. Building your own auth means risking security breaches and maintaining complex code forever."
-        },
-        "CloudFront": {
-            "strategic_reason": "CloudFront is AWS's global CDN with 400+ edge locations worldwide. It dramatically reduces latency for global users by caching content near them. A user in Tokyo loads images in 50ms instead of 500ms by fetching from a nearby edge location.",
-            "real_world_example": "Product images, CSS, JavaScript, and API responses (for GET requests) are cached at edge locations. The first user in Singapore fetches from S3 (~200ms). The next 10,000 users load from the Singapore edge in 20ms. This reduces S3 costs by 80% and improves user experience.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _cloudfront_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["CloudFront"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Price Class:</strong> All edge locations (best performance globally)</li>
                     <li><strong>Expected Transfer:</strong> ~{users*200}MB per month</li>
@@ -361,17 +490,19 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     CloudFront's first 1TB of data transfer and 10M requests per month are free for the first year. After that, pricing starts at $0.085/GB—still cheaper than serving directly from S3 due to request savings.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0/month - FREE TIER covers 1TB data transfer + 10M requests monthly<br>
                 <strong>After Year 1:</strong> ${max(1, (users*0.2*0.085)):.2f}-${max(10, (users*0.5*0.085)):.2f}/month<br>
                 <em style="color: #718096;">Data transfer: $0.085/GB. The reduced S3 requests typically offset CloudFront costs entirely!</em>
-            """,
-            "alternatives": "Cloudflare is good but adds another vendor. Fastly is powerful but expensive for smaller workloads. CloudFront integrates seamlessly with S3 and API Gateway, simplifying architecture."
-        },
-        "SES": {
-            "strategic_reason": "SES is AWS's email service, capable of sending millions of emails reliably. Unlike SendGrid or Mailgun, SES costs $0.10 per 1,000 emails with no monthly minimum. For transactional emails, it's unbeatable on price and reliability.",
-            "real_world_example": "Order confirmations, password resets, shipping notifications, and weekly newsletters all use SES. With proper DKIM/SPF setup, your emails reach inboxes, not spam folders. SES handles bounce and complaint processing automatically.",
-            "configuration": f"""
+            """
+    )
+
+
+@lru_cache(maxsize=256)
+def _ses_context(users: int) -> ServiceContext:
+    return ServiceContext(
+        **SERVICE_CONTEXT_TEXT["SES"],
+        configuration=f"""
                 <ul style="margin-left: 1.5rem; line-height: 1.8; color: #2d3748;">
                     <li><strong>Sending Limit:</strong> Start at 200 emails/day, increases to 50,000+ as reputation improves</li>
                     <li><strong>Expected Volume:</strong> ~{users*20:,} emails per month</li>
@@ -383,35 +514,54 @@ def get_service_technical_context(service_name: str, users: int, project_type: s
                     SES requires you to verify your domain and maintain good sending reputation. Start with the sandbox (100 emails/day to verified addresses) and request production access when ready.
                 </p>
             """,
-            "cost_explanation": f"""
+        cost_explanation=f"""
                 <strong>First 12 months (New AWS Account):</strong> $0/month - FREE TIER covers 62,000 emails monthly (if sent from EC2)<br>
                 <strong>After Year 1:</strong> ${max(0, (users*20/1000)*0.10):.2f}-${max(10, (users*50/1000)*0.10):.2f}/month for {users*20:,}-{users*50:,} emails<br>
                 <em style="color: #718096;">$0.10 per 1,000 emails. Compare to SendGrid ($20/month for 40K) or Mailgun ($35/month for 50K)!</em>
-            """,
-            "alternatives": "SendGrid, Mailgun, and Postmark are easier to start with (no sandbox restrictions) but cost 10-20x more at scale. For transactional emails, SES is the industry standard for cost-effectiveness."
-        }
-    }
-    
-    # Return context or generic fallback
-    return contexts.get(normalized_name, {
-        "strategic_reason": f"{service_name} is a key component of modern cloud architecture, providing essential functionality for your application.",
-        "real_world_example": f"In production, {service_name} handles critical workloads reliably and efficiently.",
-        "configuration": "<p style='color: #2d3748;'>Standard configuration optimized for your use case.</p>",
-        "cost_explanation": "Costs scale with usage. Check AWS pricing calculator for detailed estimates.",
-        "alternatives": f"{service_name} is the AWS-native solution, offering deep integration with other services."
-    })
+            """
+    )
 
 
-def generate_cost_narrative(cost_analysis: Dict, services: List[Dict], users: int) -> str:
-    """Detailed cost analysis with optimization strategies"""
-    
-    summary = cost_analysis.get('summary', {})
-    typical = summary.get('typical', '$50-100')
-    minimum = summary.get('minimum', '$20')
-    maximum = summary.get('maximum', '$200')
-    free_tier = summary.get('free_tier_viable', False)
+AWS_PREFIX_RE = re.compile(r"^(?:Amazon|AWS)\s*")
+
+SERVICE_CONTEXT_BUILDERS = {
+    "Lambda": _lambda_context,
+    "DynamoDB": _dynamodb_context,
+    "S3": _s3_context,
+    "API Gateway": _api_gateway_context,
+    "Cognito": _cognito_context,
+    "CloudFront": _cloudfront_context,
+    "SES": _ses_context,
+}
+
+
+@lru_cache(maxsize=256)
+def _context_builder(service_name: str):
+    # Normalize service name once per name: "Amazon DynamoDB" -> "DynamoDB", "AWS Lambda" -> "Lambda"
+    return SERVICE_CONTEXT_BUILDERS.get(AWS_PREFIX_RE.sub("", service_name).strip())
+
+
+@lru_cache(maxsize=256)
+def _generic_context(service_name: str) -> ServiceContext:
+    return ServiceContext(
+        strategic_reason=f"{service_name} is a key component of modern cloud architecture, providing essential functionality for your application.",
+        real_world_example=f"In production, {service_name} handles critical workloads reliably and efficiently.",
+        configuration="<p style='color: #2d3748;'>Standard configuration optimized for your use case.</p>",
+        cost_explanation="Costs scale with usage. Check AWS pricing calculator for detailed estimates.",
+        alternatives=f"{service_name} is the AWS-native solution, offering deep integration with other services."
+    )
+
+
+def get_service_technical_context(service_name: str, users: int, project_type: str) -> ServiceContext:
+    """Get rich technical context for each service"""
     
-    html = f"""
+    # Only the requested service's context is formatted; fall back to a generic one
+    builder = _context_builder(service_name)
+    return builder(users) if builder else _generic_context(service_name)
+
+
+# Cost analysis section: the summary is the only part with per-request values
+COST_SUMMARY_TEMPLATE = """
     <section class="narrative-section cost-analysis">
         <h2>💰 Cost Analysis & Financial Planning</h2>
         
@@ -423,7 +573,7 @@ def generate_cost_narrative(cost_analysis: Dict, services: List[Dict], users: in
         
         <div class="cost-summary">
             <p>
-                Based on <strong>{users:,} active users</strong> with typical usage patterns 
+                Based on <strong>{users} active users</strong> with typical usage patterns 
                 (assuming peak traffic at 3-5x average, 70% of requests during business hours, 
                 and standard data retention policies), here's your projected monthly spend:
             </p>
@@ -450,9 +600,8 @@ def generate_cost_narrative(cost_analysis: Dict, services: List[Dict], users: in
             </p>
         </div>
     """
-    
-    if free_tier:
-        html += """
+
+FREE_TIER_NOTICE = """
         <div class="free-tier-notice">
             <h4>✨ Free Tier Opportunity</h4>
             <p>
@@ -472,8 +621,8 @@ def generate_cost_narrative(cost_analysis: Dict, services: List[Dict], users: in
             </p>
         </div>
         """
-    
-    html += """
+
+COST_OPTIMIZATION = """
         <div class="cost-optimization">
             <h4>📉 Cost Optimization Strategies</h4>
             <p>
@@ -525,100 +674,28 @@ def generate_cost_narrative(cost_analysis: Dict, services: List[Dict], users: in
         </div>
     </section>
     """
-    
-    return html
 
+COST_NARRATIVE_WITH_FREE_TIER = COST_SUMMARY_TEMPLATE + FREE_TIER_NOTICE + COST_OPTIMIZATION
+COST_NARRATIVE_WITHOUT_FREE_TIER = COST_SUMMARY_TEMPLATE + COST_OPTIMIZATION
 
-def generate_implementation_narrative(guide: Dict, services: List[Dict], project_type: str) -> str:
-    """Detailed implementation roadmap with practical guidance"""
-    
-    phases = guide.get('phases', [])
-    intro = guide.get('introduction', {})
-    
-    timeline = intro.get('timeline', '20-30 hours over 5-7 days')
-    difficulty = intro.get('difficulty', 'Intermediate')
-    
-    difficulty_context = {
-        "Beginner": "This is a straightforward implementation suitable for developers new to AWS. The services are well-documented, and the AWS console provides helpful wizards for setup.",
-        "Intermediate": "This implementation requires familiarity with cloud concepts and some AWS experience. You'll be comfortable with infrastructure as code and basic networking concepts.",
-        "Advanced": "This architecture involves complex integrations and requires strong AWS expertise. Experience with distributed systems, security best practices, and performance optimization is essential."
-    }
-    
-    html = f"""
-    <section class="narrative-section implementation-guide">
-        <h2>🚀 Implementation Roadmap</h2>
-        
-        <p class="section-intro">
-            Now comes the practical part: actually building this infrastructure. I've broken down the implementation 
-            into clear, manageable phases. Each phase builds on the previous one, so you can test as you go and 
-            have a working system at each milestone.
-        </p>
-        
-        <div class="implementation-overview">
-            <h4>📋 Implementation Overview</h4>
-            <div style="background: #f7fafc; padding: 1.5rem; border-radius: 8px; margin: 1rem 0;">
-                <p style="margin-bottom: 1rem;">
-                    <strong>Estimated Timeline:</strong> {timeline}<br>
-                    <strong>Difficulty Level:</strong> {difficulty}<br>
-                    <strong>Team Size:</strong> {"1 developer" if difficulty == "Beginner" else "1-2 developers" if difficulty == "Intermediate" else "2-3 developers"}
-                </p>
-                <p style="color: #4a5568;">
-                    {difficulty_context.get(difficulty, '')}
-                </p>
-            </div>
-        </div>
-        
-        <p style="margin: 1.5rem 0; line-height: 1.8;">
-            <strong>Important:</strong> Don't rush through these phases. Deploy to a development environment first, 
-            test thoroughly, then promote to production. The time estimates assume you're working methodically with 
-            proper testing at each step—this isn't a race.
-        </p>
-    """
+
+def generate_cost_narrative(cost_analysis: dict, services: Sequence[Recommendation], users: int) -> str:
+    """Detailed cost analysis with optimization strategies"""
     
-    # Generate detailed phase descriptions
-    phase_details = {
-        "Foundation Setup": {
-            "why": "A solid foundation prevents security issues and cost surprises later. Setting up billing alerts, MFA, and IAM best practices now saves you from painful migrations when you have production traffic.",
-            "gotchas": "Don't skip MFA on the root account—it's your last line of defense. Avoid creating access keys for the root user. Always use named IAM users or roles.",
-            "success_criteria": "You can log in with MFA, see billing dashboard, have AWS CLI configured, and can create resources via console and CLI."
-        },
-        "Core Infrastructure": {
-            "why": "Your database and storage layer form the backbone of your application. Getting the data model right early prevents expensive refactoring later when you have live users.",
-            "gotchas": "DynamoDB partition keys are permanent—choose wisely. Enable point-in-time recovery from day one. S3 bucket names are globally unique and can't be changed.",
-            "success_criteria": "You can write and read data from DynamoDB, upload files to S3, and verify data persists after restart."
-        },
-        "Compute & API Layer": {
-            "why": "This is where your business logic lives. Taking time to structure Lambda functions properly (single responsibility, proper error handling) pays dividends in maintainability.",
-            "gotchas": "Lambda cold starts affect the first request after idle periods. Package size affects cold start time—keep it under 50MB. Don't store state in Lambda; use DynamoDB.",
-            "success_criteria": "API endpoints respond correctly, authentication works, errors are logged to CloudWatch, and you can debug locally with SAM."
-        },
-        "Integration & Testing": {
-            "why": "This is where everything comes together. Thorough integration testing now prevents 3am production incidents later. Test error scenarios, not just happy paths.",
-            "gotchas": "Cross-service IAM permissions are the #1 source of production bugs. Test with realistic data volumes—1 record is not representative.",
-            "success_criteria": "End-to-end workflows complete successfully, errors are handled gracefully, logs are searchable, and you understand the data flow."
-        },
-        "Production Deployment": {
-            "why": "Going to production isn't just 'aws deploy.' You need monitoring, rollback plans, and gradual traffic migration to do it safely.",
-            "gotchas": "DNS propagation takes time—plan accordingly. CloudFront distributions take 15-20 minutes to deploy. Don't make changes during peak traffic hours.",
-            "success_criteria": "Application is live, monitoring shows green, alarms are configured, and you have a documented rollback procedure."
-        }
-    }
+    summary = cost_analysis.get('summary', {})
+    typical = summary.get('typical', '$50-100')
+    minimum = summary.get('minimum', '$20')
+    maximum = summary.get('maximum', '$200')
+    free_tier = summary.get('free_tier_viable', False)
     
-    for i, phase in enumerate(phases, 1):
-        name = phase.get('name', f'Phase {i}')
-        description = phase.get('description', '')
-        duration = phase.get('duration', 'varies')
-        steps = phase.get('steps', [])
-        
-        phase_detail = phase_details.get(name, {
-            "why": "This phase implements critical components of your architecture.",
-            "gotchas": "Follow AWS best practices and test thoroughly.",
-            "success_criteria": "All components are working as expected."
-        })
-        
-        html += f"""
+    template = COST_NARRATIVE_WITH_FREE_TIER if free_tier else COST_NARRATIVE_WITHOUT_FREE_TIER
+    return template.format(users=format(users, ','), minimum=minimum, typical=typical, maximum=maximum)
+
+
+# One implementation phase; steps are rendered as <li> items into {steps}
+PHASE_TEMPLATE = """
         <div class="implementation-phase">
-            <h3>Phase {i}: {name}</h3>
+            <h3>Phase {idx}: {name}</h3>
             <p class="phase-duration"><em>⏱ Estimated time: {duration}</em></p>
             
             <p style="margin: 1rem 0; color: #2d3748;">
@@ -627,35 +704,31 @@ def generate_implementation_narrative(guide: Dict, services: List[Dict], project
             
             <div style="background: #e6fffa; border-left: 4px solid #38b2ac; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <p style="margin: 0; color: #234e52;">
-                    <strong>💡 Why this matters:</strong> {phase_detail['why']}
+                    <strong>💡 Why this matters:</strong> {why}
                 </p>
             </div>
             
             <h4>📋 Tasks</h4>
             <ol style="margin-left: 2rem; margin-top: 1rem; line-height: 2;">
-        """
-        
-        for step in steps:
-            html += f"<li>{step}</li>"
-        
-        html += f"""
+        {steps}
             </ol>
             
             <div style="background: #fff5f5; border-left: 4px solid #e53e3e; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <p style="margin: 0; color: #742a2a;">
-                    <strong>⚠️ Common pitfalls:</strong> {phase_detail['gotchas']}
+                    <strong>⚠️ Common pitfalls:</strong> {gotchas}
                 </p>
             </div>
             
             <div style="background: #f0fff4; border-left: 4px solid #48bb78; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <p style="margin: 0; color: #22543d;">
-                    <strong>✅ Success criteria:</strong> {phase_detail['success_criteria']}
+                    <strong>✅ Success criteria:</strong> {success_criteria}
                 </p>
             </div>
         </div>
         """
-    
-    html += """
+
+# Closing tips and resources of the implementation roadmap (same for every project)
+IMPLEMENTATION_TIPS = """
         <div class="implementation-tips">
             <h4>💡 Pro Tips from the Field</h4>
             <ul style="margin-left: 2rem; margin-top: 1rem; line-height: 2;">
@@ -703,14 +776,125 @@ def generate_implementation_narrative(guide: Dict, services: List[Dict], project
         </div>
     </section>
     """
+
+
+DIFFICULTY_CONTEXT = {
+    "Beginner": "This is a straightforward implementation suitable for developers new to AWS. The services are well-documented, and the AWS console provides helpful wizards for setup.",
+    "Intermediate": "This implementation requires familiarity with cloud concepts and some AWS experience. You'll be comfortable with infrastructure as code and basic networking concepts.",
+    "Advanced": "This architecture involves complex integrations and requires strong AWS expertise. Experience with distributed systems, security best practices, and performance optimization is essential."
+}
+
+TEAM_SIZE_BY_DIFFICULTY = {
+    "Beginner": "1 developer",
+    "Intermediate": "1-2 developers",
+    "Advanced": "2-3 developers"
+}
+
+
+@dataclass(frozen=True)
+class PhaseDetail:
+    """Guidance shown alongside an implementation phase"""
+    __slots__ = ("why", "gotchas", "success_criteria")
     
-    return html
+    why: str
+    gotchas: str
+    success_criteria: str
 
 
-def generate_best_practices(services: List[Dict], project_type: str, users: int) -> str:
-    """Generate best practices and common pitfalls section"""
+PHASE_DETAILS = {
+    "Foundation Setup": PhaseDetail(
+        why="A solid foundation prevents security issues and cost surprises later. Setting up billing alerts, MFA, and IAM best practices now saves you from painful migrations when you have production traffic.",
+        gotchas="Don't skip MFA on the root account—it's your last line of defense. Avoid creating access keys for the root user. Always use named IAM users or roles.",
+        success_criteria="You can log in with MFA, see billing dashboard, have AWS CLI configured, and can create resources via console and CLI."
+    ),
+    "Core Infrastructure": PhaseDetail(
+        why="Your database and storage layer form the backbone of your application. Getting the data model right early prevents expensive refactoring later when you have live users.",
+        gotchas="DynamoDB partition keys are permanent—choose wisely. Enable point-in-time recovery from day one. S3 bucket names are globally unique and can't be changed.",
+        success_criteria="You can write and read data from DynamoDB, upload files to S3, and verify data persists after restart."
+    ),
+    "Compute & API Layer": PhaseDetail(
+        why="This is where your business logic lives. Taking time to structure Lambda functions properly (single responsibility, proper error handling) pays dividends in maintainability.",
+        gotchas="Lambda cold starts affect the first request after idle periods. Package size affects cold start time—keep it under 50MB. Don't store state in Lambda; use DynamoDB.",
+        success_criteria="API endpoints respond correctly, authentication works, errors are logged to CloudWatch, and you can debug locally with SAM."
+    ),
+    "Integration & Testing": PhaseDetail(
+        why="This is where everything comes together. Thorough integration testing now prevents 3am production incidents later. Test error scenarios, not just happy paths.",
+        gotchas="Cross-service IAM permissions are the #1 source of production bugs. Test with realistic data volumes—1 record is not representative.",
+        success_criteria="End-to-end workflows complete successfully, errors are handled gracefully, logs are searchable, and you understand the data flow."
+    ),
+    "Production Deployment": PhaseDetail(
+        why="Going to production isn't just 'aws deploy.' You need monitoring, rollback plans, and gradual traffic migration to do it safely.",
+        gotchas="DNS propagation takes time—plan accordingly. CloudFront distributions take 15-20 minutes to deploy. Don't make changes during peak traffic hours.",
+        success_criteria="Application is live, monitoring shows green, alarms are configured, and you have a documented rollback procedure."
+    )
+}
+
+DEFAULT_PHASE_DETAIL = PhaseDetail(
+    why="This phase implements critical components of your architecture.",
+    gotchas="Follow AWS best practices and test thoroughly.",
+    success_criteria="All components are working as expected."
+)
+
+
+def generate_implementation_narrative(guide: GuideResult, services: Sequence[Recommendation], project_type: str) -> str:
+    """Detailed implementation roadmap with practical guidance"""
+    
+    phases = guide.phases
+    timeline = guide.introduction.timeline
+    difficulty = guide.introduction.difficulty
+    
+    chunks = [f"""
+    <section class="narrative-section implementation-guide">
+        <h2>🚀 Implementation Roadmap</h2>
+        
+        <p class="section-intro">
+            Now comes the practical part: actually building this infrastructure. I've broken down the implementation 
+            into clear, manageable phases. Each phase builds on the previous one, so you can test as you go and 
+            have a working system at each milestone.
+        </p>
+        
+        <div class="implementation-overview">
+            <h4>📋 Implementation Overview</h4>
+            <div style="background: #f7fafc; padding: 1.5rem; border-radius: 8px; margin: 1rem 0;">
+                <p style="margin-bottom: 1rem;">
+                    <strong>Estimated Timeline:</strong> {timeline}<br>
+                    <strong>Difficulty Level:</strong> {difficulty}<br>
+                    <strong>Team Size:</strong> {TEAM_SIZE_BY_DIFFICULTY.get(difficulty, "2-3 developers")}
+                </p>
+                <p style="color: #4a5568;">
+                    {DIFFICULTY_CONTEXT.get(difficulty, '')}
+                </p>
+            </div>
+        </div>
+        
+        <p style="margin: 1.5rem 0; line-height: 1.8;">
+            <strong>Important:</strong> Don't rush through these phases. Deploy to a development environment first, 
+            test thoroughly, then promote to production. The time estimates assume you're working methodically with 
+            proper testing at each step—this isn't a race.
+        </p>
+    """]
     
-    return """
+    for i, phase in enumerate(phases, 1):
+        steps = phase.steps
+        phase_detail = PHASE_DETAILS.get(phase.name, DEFAULT_PHASE_DETAIL)
+        
+        chunks.append(PHASE_TEMPLATE.format(
+            idx=i,
+            name=phase.name,
+            duration=phase.duration,
+            description=phase.description,
+            why=phase_detail.why,
+            steps="<li>" + "</li><li>".join(steps) + "</li>" if steps else "",
+            gotchas=phase_detail.gotchas,
+            success_criteria=phase_detail.success_criteria
+        ))
+    
+    chunks.append(IMPLEMENTATION_TIPS)
+    return "".join(chunks)
+
+
+# Static: the same best-practices section is returned for every project
+BEST_PRACTICES_HTML = """
     <section class="narrative-section best-practices">
         <h2>⚠️ Critical Best Practices & Common Pitfalls</h2>
         
@@ -859,20 +1043,21 @@ def generate_best_practices(services: List[Dict], project_type: str, users: int)
     """
 
 
-def generate_conclusion(project_type: str, users: int) -> str:
-    """Comprehensive conclusion with actionable next steps"""
-    
-    conclusions = {
-        "ecommerce": "With this architecture in place, you have a production-ready e-commerce platform that can scale from your first customer to millions. The serverless approach means you pay only for actual usage, making it perfect for startups with unpredictable traffic.",
-        "api": "This API architecture provides enterprise-grade capabilities—authentication, throttling, monitoring, and scaling—without the operational burden of managing servers. You can focus on building features instead of infrastructure.",
-        "social": "You've built a social platform foundation that can handle viral growth. With CloudFront's global distribution and Lambda's auto-scaling, your users worldwide will have a fast, responsive experience even during traffic spikes.",
-        "saas": "This SaaS architecture ensures every customer's data remains isolated and secure while allowing you to operate a single infrastructure. You can onboard new customers in seconds without infrastructure changes.",
-        "web_application": "Your web application now runs on enterprise-grade infrastructure that scales automatically and costs pennies when idle. Focus on building features your users love instead of managing servers."
-    }
-    
-    conclusion = conclusions.get(project_type, conclusions["web_application"])
+def generate_best_practices(services: Sequence[Recommendation], project_type: str, users: int) -> str:
+    """Generate best practices and common pitfalls section"""
     
-    return f"""
+    return BEST_PRACTICES_HTML
+
+
+PROJECT_CONCLUSIONS = {
+    "ecommerce": "With this architecture in place, you have a production-ready e-commerce platform that can scale from your first customer to millions. The serverless approach means you pay only for actual usage, making it perfect for startups with unpredictable traffic.",
+    "api": "This API architecture provides enterprise-grade capabilities—authentication, throttling, monitoring, and scaling—without the operational burden of managing servers. You can focus on building features instead of infrastructure.",
+    "social": "You've built a social platform foundation that can handle viral growth. With CloudFront's global distribution and Lambda's auto-scaling, your users worldwide will have a fast, responsive experience even during traffic spikes.",
+    "saas": "This SaaS architecture ensures every customer's data remains isolated and secure while allowing you to operate a single infrastructure. You can onboard new customers in seconds without infrastructure changes.",
+    "web_application": "Your web application now runs on enterprise-grade infrastructure that scales automatically and costs pennies when idle. Focus on building features your users love instead of managing servers."
+}
+
+CONCLUSION_TEMPLATE = """
     <section class="narrative-section conclusion">
         <h2>✅ You're Ready to Build</h2>
         
@@ -948,3 +1133,15 @@ def generate_conclusion(project_type: str, users: int) -> str:
         </p>
     </section>
     """
+
+# Only the opening paragraph depends on the project type, so every variant is rendered at import
+CONCLUSION_SECTIONS = {
+    project_type: CONCLUSION_TEMPLATE.format(conclusion=conclusion)
+    for project_type, conclusion in PROJECT_CONCLUSIONS.items()
+}
+
+
+def generate_conclusion(project_type: str, users: int) -> str:
+    """Comprehensive conclusion with actionable next steps"""
+    
+    return CONCLUSION_SECTIONS.get(project_type, CONCLUSION_SECTIONS["web_application"])